@@ -3,48 +3,140 @@ import os
 import discord
 from discord.ext import tasks, commands
 from pyVinted import Vinted
-import json
+import orjson
 import logging
-from datetime import datetime, timezone
+import re
+import functools
+import random
+from datetime import datetime
 import asyncio
-import requests
+import aiohttp
+from collections import deque
+from types import MappingProxyType
+from cachetools import TTLCache
+from aiolimiter import AsyncLimiter
 
 TOKEN = "INSERT DISCORD BOT TOKEN HERE"
+RAPIDAPI_HOST = "vinted6.p.rapidapi.com"
+RAPIDAPI_KEY = "INSERT RAPID API KEY HERE"
+# Requests allowed per period on your RapidAPI plan
+RAPIDAPI_MAX_RATE = 5
+RAPIDAPI_TIME_PERIOD = 1  # seconds
+RAPIDAPI_RETRIES = 3
+# Longest Retry-After worth waiting for; roughly one polling tick
+RAPIDAPI_MAX_RETRY_DELAY = 10  # seconds
+# Total time allowed for one RapidAPI request, so a slow call can't hold up a whole tick
+RAPIDAPI_TIMEOUT = 10  # seconds
+SENT_ITEMS_LIMIT = 10000
+LIVE_MESSAGE_MAX_AGE = 86400  # seconds
+
+# Static embed scaffolding shared by every item message
+EMBED_COLOR = 5763719
+EMBED_FOOTER = "VintBot"
+_TIME_FIELD = "⌛ Time Uploaded"
+_BRAND_FIELD = "🔖 Brand"
+_SIZE_FIELD = "📏 Size"
+_PRICE_FIELD = "💰 Price"
+_CONDITION_FIELD = "🏷 Condition"
+_RATING_FIELD = "⭐ Seller Rating"
+_MSG_URL = "https://www.vinted.co.uk/items/%s/want_it/new?button_name=receiver_id=%s"
+_BUY_URL = "https://www.vinted.co.uk/transaction/buy/new?source_screen=item&transaction%%5Bitem_id%%5D=%s"
 
 logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
 
 def load_brand_channels(filename='brand_channels.json'):
     try:
-        with open(filename, 'r') as f:
-            data = json.load(f)
+        with open(filename, 'rb') as f:
+            data = orjson.loads(f.read())
             return data.get('channel_mappings', {})
     except Exception as e:
-        logging.error(f"Error loading brand channels: {str(e)}")
+        log.error("Error loading brand channels: %s", e)
         return {}
 
+def _make_view(item_id, url):
+    """Build the link buttons for an item. Discord needs a fresh View per message."""
+    view = discord.ui.View()
+    view.add_item(discord.ui.Button(style=discord.ButtonStyle.link, label="View", url=url))
+    view.add_item(discord.ui.Button(
+        style=discord.ButtonStyle.link,
+        label="Send Message",
+        url=_MSG_URL % (item_id, item_id)
+    ))
+    view.add_item(discord.ui.Button(
+        style=discord.ButtonStyle.link,
+        label="Buy",
+        url=_BUY_URL % item_id
+    ))
+    return view
+
+def create_alias_mapping(brand_channels):
+    """Create a read-only mapping of aliases to their main brand names"""
+    alias_mapping = {}
+    for brand, data in brand_channels.items():
+        channel_id = data['channel_id']
+        aliases = data.get('aliases', [])
+        for alias in aliases:
+            alias_mapping[alias.lower()] = MappingProxyType({
+                'main_brand': brand,
+                'channel_id': channel_id
+            })
+    return MappingProxyType(alias_mapping)
+
+# Brand config is loaded and flattened once at import and shared by every bot instance
+BRAND_CHANNELS = MappingProxyType(load_brand_channels())
+ALIAS_MAPPING = create_alias_mapping(BRAND_CHANNELS)
+
+# Brands matched anywhere inside a longer brand title
+SPECIFIC_BRANDS = ("cole buxton", "acne studios", "our legacy", "canada goose",
+                   "palace", "bape", "clints", "stussy")
+_SPECIFIC_BRAND_DATA = MappingProxyType({
+    brand: ALIAS_MAPPING[brand] for brand in SPECIFIC_BRANDS if brand in ALIAS_MAPPING
+})
+# Plain substring alternation, so "bapesta" or "palaceskateboards" still match. The
+# lookahead finds overlapping hits too, e.g. both "clints" and "stussy" in "clintstussy".
+_SPECIFIC_BRAND_RE = (
+    re.compile("(?=(%s))" % "|".join(map(re.escape, _SPECIFIC_BRAND_DATA)))
+    if _SPECIFIC_BRAND_DATA else None
+)
+# Position of each alias in the config, used to break ties between partial matches
+_ALIAS_ORDER = MappingProxyType({alias: index for index, alias in enumerate(ALIAS_MAPPING)})
+
 class MyBot(commands.Bot):
+    # Size titles indicating children's clothing
+    _CHILD_RE = re.compile(r"months|years|child|kids|baby", re.IGNORECASE)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.sent_items = []
-        self.brand_channels = load_brand_channels()
-        self.brand_aliases = self._create_alias_mapping()
+        self.sent_items = set()
+        self.sent_items_order = deque(maxlen=SENT_ITEMS_LIMIT)
+        self.brand_channels = BRAND_CHANNELS
+        self.brand_aliases = ALIAS_MAPPING
+        self._match_brand_cached = functools.lru_cache(maxsize=2048)(self._match_brand)
         self.allowed_price = 200
         self.allowed_country_code = "co.uk"
+        self._vinted_search_url = (
+            f"https://www.vinted.co.uk/vetement?order=newest_first&price_to={self.allowed_price}"
+            f"&currency=GBP&country_code={self.allowed_country_code}"
+        )
         self.vinted = Vinted()
         self.check_vinted_task = self.check_vinted
-
-    def _create_alias_mapping(self):
-        """Create a mapping of aliases to their main brand names"""
-        alias_mapping = {}
-        for brand, data in self.brand_channels.items():
-            channel_id = data['channel_id']
-            aliases = data.get('aliases', [])
-            for alias in aliases:
-                alias_mapping[alias.lower()] = {
-                    'main_brand': brand,
-                    'channel_id': channel_id
-                }
-        return alias_mapping
+        self._http = None
+        self._live_messages = []
+        self._brand_channel_objects = {}
+        self._api_sem = None
+        self._rapidapi_limiter = None
+        self._feedback_cache = TTLCache(maxsize=5000, ttl=300)
+        self._desc_cache = TTLCache(maxsize=20000, ttl=3600)
+        self._feedback_in_flight = {}
+        self._desc_in_flight = {}
+
+    def _mark_sent(self, item_id):
+        """Remember a sent item ID, evicting the oldest once the limit is reached"""
+        if len(self.sent_items_order) >= SENT_ITEMS_LIMIT:
+            self.sent_items.discard(self.sent_items_order[0])
+        self.sent_items_order.append(item_id)
+        self.sent_items.add(item_id)
 
     def _find_matching_brand(self, brand_title):
         """
@@ -54,14 +146,31 @@ class MyBot(commands.Bot):
             brand_title (str): The brand title from the Vinted item
             
         Returns:
-            dict: Contains 'main_brand' and 'channel_id' if match found, None otherwise
+            str: The main brand name if match found, None otherwise
         """
         if not brand_title:
             return None
         
         # Normalize the input brand title
         brand_lower = brand_title.lower().strip()
+
+        match = self._match_brand_cached(brand_lower)
+        if match is None:
+            log.debug("No brand match found for: %s (normalized: %s)", brand_title, brand_lower)
+            return None
+        return match['main_brand']
+
+    def _match_brand(self, brand_lower):
+        """
+        Match a normalized brand title against the aliases. Wrapped in an LRU cache
+        per instance, as the alias mapping is fixed at import.
         
+        Args:
+            brand_lower (str): The lowercased, stripped brand title
+            
+        Returns:
+            dict: Contains 'main_brand' and 'channel_id' if match found, None otherwise
+        """
         # Try exact match first
         if brand_lower in self.brand_aliases:
             return self.brand_aliases[brand_lower]
@@ -80,107 +189,192 @@ class MyBot(commands.Bot):
             if variation in self.brand_aliases:
                 return self.brand_aliases[variation]
         
-        # If no exact match found, try partial matching for complex brand names
-        for alias, data in self.brand_aliases.items():
-
-            if " x " in brand_lower:
-                brand_parts = brand_lower.split(" x ")
-                if any(part.strip() == alias for part in brand_parts):
-                    return data
-            
-
-            specific_brands = ["cole buxton", "acne studios", "our legacy", "canada goose", 
-                             "palace", "bape", "clints", "stussy"]
-            if alias in specific_brands and alias in brand_lower:
-                return data
+        # Collaborations such as "palace x ralph lauren" match on either side, and
+        # specific brands match anywhere inside a longer title
+        candidates = []
+        if " x " in brand_lower:
+            for part in brand_lower.split(" x "):
+                part = part.strip()
+                if part in self.brand_aliases:
+                    candidates.append(part)
+        if _SPECIFIC_BRAND_RE:
+            candidates.extend(match.group(1) for match in _SPECIFIC_BRAND_RE.finditer(brand_lower))
+
+        # The alias listed first in the config wins, e.g. "stussy x nike" goes to nike
+        if candidates:
+            return self.brand_aliases[min(candidates, key=_ALIAS_ORDER.__getitem__)]
         
-        logging.debug(f"No brand match found for: {brand_title} (normalized: {brand_lower})")
         return None
 
     async def setup_hook(self):
-        logging.info("Bot is setting up...")
+        log.info("Bot is setting up...")
+        # One pooled session for the bot's lifetime keeps RapidAPI connections alive
+        connector = aiohttp.TCPConnector(
+            limit=50,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        self._http = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=RAPIDAPI_TIMEOUT),
+            headers={
+                "x-rapidapi-host": RAPIDAPI_HOST,
+                "x-rapidapi-key": RAPIDAPI_KEY
+            }
+        )
+        # Created here so they bind to the loop started by bot.run() on Python < 3.10
+        self._api_sem = asyncio.Semaphore(10)
+        self._rapidapi_limiter = AsyncLimiter(RAPIDAPI_MAX_RATE, RAPIDAPI_TIME_PERIOD)
         self.check_vinted_task.start()
+        self.update_live_messages.start()
+
+    async def close(self):
+        if self._http is not None:
+            await self._http.close()
+        await super().close()
 
     async def on_connect(self):
-        logging.info(f"Connected to Discord (latency: {self.latency * 1000:.2f} ms)")
+        log.info("Connected to Discord (latency: %.2f ms)", self.latency * 1000)
 
     async def on_ready(self):
-        logging.info(f'Logged in as {self.user} (ID: {self.user.id})')
-        logging.info(f'Connected to {len(self.guilds)} guilds')
+        log.info('Logged in as %s (ID: %s)', self.user, self.user.id)
+        log.info('Connected to %d guilds', len(self.guilds))
         print(f'Bot connected as {self.user}')
         await self.change_presence(activity=discord.Game(name="Searching Vinted"))
 
+    def _resolve_brand_channels(self):
+        """Map each main brand to its channel object once, rather than per item"""
+        channels = {}
+        for brand, data in self.brand_channels.items():
+            channel = self.get_channel(int(data['channel_id']))
+            if channel is None:
+                log.warning("Channel with ID %s for brand %s not found.", data['channel_id'], brand)
+                continue
+            channels[brand] = channel
+        self._brand_channel_objects = channels
+
     def fetch_vinted_items(self):
         try:
-            items = self.vinted.items.search(
-                f"https://www.vinted.co.uk/vetement?order=newest_first&price_to={self.allowed_price}&currency=GBP&country_code={self.allowed_country_code}", 10, 1
-            )
-            logging.debug(f"Fetched items: {items}")
+            items = self.vinted.items.search(self._vinted_search_url, 10, 1)
+            log.debug("Fetched items: %s", items)
             return items
         except Exception as e:
-            logging.error(f"Failed to fetch Vinted items: {str(e)}")
+            log.error("Failed to fetch Vinted items: %s", e)
+            return None
+
+    def _retry_delay(self, headers, attempt):
+        """
+        Seconds to wait before retrying, preferring the server's Retry-After hint.
+        Returns None if the server asks for longer than RAPIDAPI_MAX_RETRY_DELAY.
+        """
+        try:
+            delay = float(headers.get("Retry-After"))
+        except (AttributeError, TypeError, ValueError):
+            delay = 2 ** attempt
+        if delay > RAPIDAPI_MAX_RETRY_DELAY:
             return None
+        # Jitter so concurrent fetches don't retry in lockstep
+        return delay + random.uniform(0, 0.25)
+
+    async def _fetch_cached(self, cache, in_flight, key, request):
+        """Return a cached result, joining an identical request that is already in flight"""
+        if key in cache:
+            return cache[key]
+
+        task = in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(request(key))
+            in_flight[key] = task
+            task.add_done_callback(lambda _: in_flight.pop(key, None))
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def fetch_user_feedback(self, user_id):
+        return await self._fetch_cached(
+            self._feedback_cache, self._feedback_in_flight, user_id, self._request_user_feedback
+        )
+
+    async def fetch_item_description(self, item_id):
+        return await self._fetch_cached(
+            self._desc_cache, self._desc_in_flight, item_id, self._request_item_description
+        )
+
+    async def _request_user_feedback(self, user_id):
+        url = f"https://{RAPIDAPI_HOST}/getUserByID"
 
-    def fetch_user_feedback(self, user_id):
-        url = f"https://vinted6.p.rapidapi.com/getUserByID?country=gb&user_id={user_id}"
-        headers = {
-            "x-rapidapi-host": "vinted6.p.rapidapi.com",
-            "x-rapidapi-key": "INSERT RAPID API KEY HERE"
+        params = {
+            "country": "gb",
+            "user_id": str(user_id)
         }
 
-        for attempt in range(3):
+        for attempt in range(RAPIDAPI_RETRIES):
+            last_attempt = attempt == RAPIDAPI_RETRIES - 1
             try:
-                response = requests.get(url, headers=headers)
-                response.raise_for_status()
-                feedback_data = response.json()
-                logging.debug(f"Feedback data for user {user_id}: {feedback_data}")
+                async with self._rapidapi_limiter, self._http.get(url, params=params) as response:
+                    response.raise_for_status()
+                    feedback_data = orjson.loads(await response.read())
+                log.debug("Feedback data for user %s: %s", user_id, feedback_data)
+                self._feedback_cache[user_id] = feedback_data
                 return feedback_data
-            except requests.exceptions.HTTPError as http_err:
-                logging.error(f"HTTP error occurred: {http_err}")
-                if response.status_code == 429:
-                    logging.warning("Rate limit exceeded. Retrying...")
-                    time.sleep(2 ** attempt)
-                else:
+            except aiohttp.ClientResponseError as http_err:
+                log.error("HTTP error occurred: %s", http_err)
+                if http_err.status != 429 or last_attempt:
+                    break
+                delay = self._retry_delay(http_err.headers, attempt)
+                if delay is None:
+                    log.warning("Rate limit exceeded and Retry-After is too long. Giving up.")
                     break
-            except requests.exceptions.RequestException as e:
-                logging.error(f"Request error: {e}")
-                time.sleep(2 ** attempt)
+                log.warning("Rate limit exceeded. Retrying...")
+                await asyncio.sleep(delay)
+            except orjson.JSONDecodeError as e:
+                log.error("Invalid JSON in response: %s", e)
+                break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                log.error("Request error: %s", e)
+                if not last_attempt:
+                    await asyncio.sleep(2 ** attempt)
 
-        logging.error(f"Failed to fetch feedback for user {user_id} after retries.")
+        log.error("Failed to fetch feedback for user %s after retries.", user_id)
         return None
 
-    def fetch_item_description(self, item_id):
-        url = f"https://vinted6.p.rapidapi.com/getProductByID"
-        
-        headers = {
-            "x-rapidapi-host": "vinted6.p.rapidapi.com",
-            "x-rapidapi-key": "INSERT RAPID API KEY HERE"
-        }
-        
+    async def _request_item_description(self, item_id):
+        url = f"https://{RAPIDAPI_HOST}/getProductByID"
+
         params = {
             "country": "gb",
             "product_id": str(item_id)
         }
 
-        for attempt in range(3):
+        for attempt in range(RAPIDAPI_RETRIES):
+            last_attempt = attempt == RAPIDAPI_RETRIES - 1
             try:
-                response = requests.get(url, headers=headers, params=params)
-                response.raise_for_status()
-                item_data = response.json()
-                logging.debug(f"Description data for item {item_id}: {item_data}")
-                return item_data.get('description')
-            except requests.exceptions.HTTPError as http_err:
-                logging.error(f"HTTP error occurred: {http_err}")
-                if response.status_code == 429:
-                    logging.warning("Rate limit exceeded. Retrying...")
-                    time.sleep(2 ** attempt)
-                else:
+                async with self._rapidapi_limiter, self._http.get(url, params=params) as response:
+                    response.raise_for_status()
+                    item_data = orjson.loads(await response.read())
+                log.debug("Description data for item %s: %s", item_id, item_data)
+                description = item_data.get('description')
+                self._desc_cache[item_id] = description
+                return description
+            except aiohttp.ClientResponseError as http_err:
+                log.error("HTTP error occurred: %s", http_err)
+                if http_err.status != 429 or last_attempt:
+                    break
+                delay = self._retry_delay(http_err.headers, attempt)
+                if delay is None:
+                    log.warning("Rate limit exceeded and Retry-After is too long. Giving up.")
                     break
-            except requests.exceptions.RequestException as e:
-                logging.error(f"Request error: {e}")
-                time.sleep(2 ** attempt)
+                log.warning("Rate limit exceeded. Retrying...")
+                await asyncio.sleep(delay)
+            except orjson.JSONDecodeError as e:
+                log.error("Invalid JSON in response: %s", e)
+                break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                log.error("Request error: %s", e)
+                if not last_attempt:
+                    await asyncio.sleep(2 ** attempt)
 
-        logging.error(f"Failed to fetch description for item {item_id} after retries.")
+        log.error("Failed to fetch description for item %s after retries.", item_id)
         return None
 
     def get_star_rating(self, reputation_percentage):
@@ -190,7 +384,7 @@ class MyBot(commands.Bot):
         stars = '⭐️' * star_count
         return stars
 
-    async def send_item_to_discord(self, channel, item, user_feedback):
+    async def send_item_to_discord(self, channel, item, user_feedback, rapid_api_description=None):
         try:
             # Extract basic item information
             titler = item.title if item.title else "Not found"
@@ -201,15 +395,14 @@ class MyBot(commands.Bot):
             condition = item.status if hasattr(item, 'status') else "Not specified"
             size = item.size_title if item.size_title else "Not specified"
 
-            # Fetch and use RapidAPI description
-            rapid_api_description = self.fetch_item_description(item.id)
+            # Prefer the RapidAPI description fetched in check_vinted
             description = rapid_api_description if rapid_api_description else item.description
             
             # Add logging for description source
             if rapid_api_description:
-                logging.debug(f"Using RapidAPI description for item {item.id}")
+                log.debug("Using RapidAPI description for item %s", item.id)
             else:
-                logging.debug(f"Using fallback description for item {item.id}")
+                log.debug("Using fallback description for item %s", item.id)
 
             # Extract user feedback information
             positive_feedback = user_feedback.get('positive_feedback_count', 0) if user_feedback else 0
@@ -222,11 +415,13 @@ class MyBot(commands.Bot):
             star_rating = self.get_star_rating(reputation_percentage)
 
             # Handle timestamp
-            created_at_ts = item.created_at_ts
-            if isinstance(created_at_ts, datetime):
-                created_at = created_at_ts
-            else:
-                created_at = datetime.now(timezone.utc)
+            created_at = getattr(item, 'created_at_epoch', None)
+            if not isinstance(created_at, int):
+                created_at_ts = getattr(item, 'created_at_ts', None)
+                if isinstance(created_at_ts, datetime):
+                    created_at = int(created_at_ts.timestamp())
+                else:
+                    created_at = int(time.time())
             create = self.time_ago(created_at)
 
             # Format price
@@ -237,57 +432,42 @@ class MyBot(commands.Bot):
             embed = discord.Embed(
                 title=titler,
                 description=f"**[New item found!]({url})**\n\n{description}",
-                color=5763719
+                color=EMBED_COLOR
             )
             
             # Set embed images
             embed.set_image(url=screen)
             
             # Add main item fields
-            embed.add_field(name="⌛ Time Uploaded", value=create, inline=True)
-            embed.add_field(name="🔖 Brand", value=brand, inline=True)
-            embed.add_field(name="📏 Size", value=size, inline=True)
-            embed.add_field(name="💰 Price", value=price_str, inline=True)
-            embed.add_field(name="🏷 Condition", value=condition, inline=True)
+            embed.add_field(name=_TIME_FIELD, value=create, inline=True)
+            embed.add_field(name=_BRAND_FIELD, value=brand, inline=True)
+            embed.add_field(name=_SIZE_FIELD, value=size, inline=True)
+            embed.add_field(name=_PRICE_FIELD, value=price_str, inline=True)
+            embed.add_field(name=_CONDITION_FIELD, value=condition, inline=True)
             
             # Add seller rating with total feedback count
-            embed.add_field(name="⭐ Seller Rating", value=f"{star_rating} ({total_feedback})", inline=True)
+            embed.add_field(name=_RATING_FIELD, value=f"{star_rating} ({total_feedback})", inline=True)
 
             # Set footer
-            embed.set_footer(text="VintBot")
+            embed.set_footer(text=EMBED_FOOTER)
 
             # Create buttons
-            view = discord.ui.View()
-            view_button = discord.ui.Button(style=discord.ButtonStyle.link, label="View", url=url)
-            send_message_button = discord.ui.Button(
-                style=discord.ButtonStyle.link,
-                label="Send Message",
-                url=f"https://www.vinted.co.uk/items/{item.id}/want_it/new?button_name=receiver_id={item.id}"
-            )
-            buy_button = discord.ui.Button(
-                style=discord.ButtonStyle.link,
-                label="Buy",
-                url=f"https://www.vinted.co.uk/transaction/buy/new?source_screen=item&transaction%5Bitem_id%5D={item.id}"
-            )
+            view = _make_view(item.id, url)
 
-            # Add buttons to view
-            view.add_item(view_button)
-            view.add_item(send_message_button)
-            view.add_item(buy_button)
-
-            # Send message and start update task
+            # Send message and register it for time updates
             message = await channel.send(embed=embed, view=view)
-            logging.info(f"Sent item: {item.title}")
-            self.loop.create_task(self.update_time_difference(message, created_at))
+            log.info("Sent item: %s", item.title)
+            self._live_messages.append((message, created_at, create))
                 
         except Exception as e:
-            logging.error(f"Failed to send item to Discord: {str(e)}")
-            logging.exception("Full traceback:")
+            log.error("Failed to send item to Discord: %s", e)
+            log.exception("Full traceback:")
 
-    def time_ago(self, created_at):
-        now = datetime.now(timezone.utc)
-        diff = now - created_at
-        seconds_diff = int(diff.total_seconds())
+    def time_ago(self, created_at, now=None):
+        # created_at and now are Unix epoch seconds
+        if now is None:
+            now = int(time.time())
+        seconds_diff = now - created_at
 
         if seconds_diff < 60:
             return f"{seconds_diff} seconds ago"
@@ -301,28 +481,59 @@ class MyBot(commands.Bot):
             days = seconds_diff // 86400
             return f"{days} day{'s' if days != 1 else ''} ago"
 
-    async def update_time_difference(self, message, created_at):
-        while True:
-            await asyncio.sleep(60)
-            now = datetime.now(timezone.utc)
-            time_diff = self.time_ago(created_at)
+    @tasks.loop(seconds=60)
+    async def update_live_messages(self):
+        """Refresh the upload time on sent messages, editing only when the text changes"""
+        entries, self._live_messages = self._live_messages, []
+        now = int(time.time())
+        live = []
+        index = 0
+
+        try:
+            while index < len(entries):
+                entry = await self._refresh_live_message(entries[index], now)
+                if entry is not None:
+                    live.append(entry)
+                index += 1
+        finally:
+            # Keep unvisited entries and messages sent while this sweep was running
+            self._live_messages = live + entries[index:] + self._live_messages
+
+    async def _refresh_live_message(self, entry, now):
+        """Update one tracked message. Returns the entry to keep tracking, or None to drop it."""
+        message, created_at, last_time_diff = entry
+
+        # Stop updating once the "days ago" bucket barely changes
+        if now - created_at > LIVE_MESSAGE_MAX_AGE:
+            return None
+
+        time_diff = self.time_ago(created_at, now)
+        if time_diff == last_time_diff:
+            return entry
 
+        try:
             embed = message.embeds[0]
-            embed.set_field_at(0, name="⌛ Time Uploaded", value=time_diff, inline=True)
+            embed.set_field_at(0, name=_TIME_FIELD, value=time_diff, inline=True)
+            await message.edit(embed=embed)
+        except discord.errors.NotFound:
+            return None
+        except discord.errors.HTTPException as e:
+            if e.code == 50001:
+                log.error("Missing permissions to edit message: %s", e)
+                return None
+            elif e.code == 50034:
+                log.info("Message is too old to edit, stopping updates")
+                return None
+            log.error("Failed to edit message: %s", e)
+            return entry
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            log.error("Failed to edit message: %s", e)
+            return entry
+        except Exception:
+            log.exception("Unexpected error updating message %s, stopping updates", message.id)
+            return None
 
-            try:
-                await message.edit(embed=embed)
-            except discord.errors.NotFound:
-                break
-            except discord.errors.HTTPException as e:
-                if e.code == 50001:
-                    logging.error(f"Missing permissions to edit message: {e}")
-                    break
-                elif e.code == 50034:
-                    logging.info("Message is too old to edit, stopping updates")
-                    break
-                else:
-                    logging.error(f"Failed to edit message: {e}")
+        return (message, created_at, time_diff)
 
     def _is_child_size(self, size_title):
         """
@@ -334,59 +545,88 @@ class MyBot(commands.Bot):
         Returns:
             bool: True if it's a child size, False otherwise
         """
-        if not size_title:
-            return False
-            
-        size_lower = size_title.lower()
-        child_indicators = ['months', 'years', 'child', 'kids', 'baby']
-        
-        return any(indicator in size_lower for indicator in child_indicators)
+        return bool(size_title and self._CHILD_RE.search(size_title))
+
+    async def _enrich(self, item, user_id):
+        """Fetch seller feedback and item description, bounded by the API semaphore."""
+        async with self._api_sem:
+            return await asyncio.gather(
+                self.fetch_user_feedback(user_id),
+                self.fetch_item_description(item.id)
+            )
 
     @tasks.loop(seconds=10)
     async def check_vinted(self):
-        logging.info("Checking Vinted for new items...")
+        log.info("Checking Vinted for new items...")
         items = self.fetch_vinted_items()
         if items is None:
             return
 
+        candidates = []
+        # Filters run cheapest-first and only read plain Item attributes, so
+        # rejected items never trigger the lazy description/timestamp extraction
         for item in items:
-            user_id = item.raw_data.get('user', {}).get('id')
-            brand_title = item.brand_title.lower() if item.brand_title else ""
+            # Ensure item is not already sent
+            if item.id in self.sent_items:
+                continue
+
+            # Find matching brand and channel
+            brand = self._find_matching_brand(item.brand_title)
+            if not brand:
+                log.debug("Skipping item %s: No matching brand found.", item.title)
+                continue
 
             # Skip children's sizes
             if self._is_child_size(item.size_title):
-                logging.debug(f"Skipping item {item.title}: Children's size detected ({item.size_title})")
+                log.debug("Skipping item %s: Children's size detected (%s)", item.title, item.size_title)
                 continue
 
-            # Find matching brand and channel
-            brand_match = self._find_matching_brand(brand_title)
-            
-            # Skip items if there is no brand match or if the user ID is missing
-            if not brand_match:
-                logging.debug(f"Skipping item {item.title}: No matching brand found.")
-                continue
+            # Skip items if the user ID is missing
+            user_id = item.user_id
             if user_id is None:
-                logging.debug(f"Skipping item {item.title}: User ID is missing.")
+                log.debug("Skipping item %s: User ID is missing.", item.title)
                 continue
 
-            # Ensure item is not already sent
-            if item.id not in self.sent_items:
-                channel_id = brand_match['channel_id']
-                channel = self.get_channel(channel_id)
-
+            channel = self._brand_channel_objects.get(brand)
+            if channel is None:
+                # Channels missing at startup (unavailable or later-joined guilds) may
+                # have appeared in the cache since; unresolved ones were already reported
+                channel = self.get_channel(int(self.brand_channels[brand]['channel_id']))
                 if channel is None:
-                    logging.error(f"Channel with ID {channel_id} not found.")
+                    log.debug("Skipping item %s: Channel for brand %s not found.", item.title, brand)
                     continue
+                self._brand_channel_objects[brand] = channel
 
-                logging.debug(f"Sending item {item.id} to channel {channel.name} (Brand: {brand_match['main_brand']})")
+            log.debug("Sending item %s to channel %s (Brand: %s)", item.id, channel.name, brand)
+            candidates.append((channel, item, user_id))
 
-                user_feedback = self.fetch_user_feedback(user_id)
-                
-                try:
-                    await self.send_item_to_discord(channel, item, user_feedback)
-                    self.sent_items.append(item.id)
-                except Exception as e:
-                    logging.error(f"Error sending item to Discord: {str(e)}")
+        if not candidates:
+            return
+
+        # Fetch RapidAPI data for every candidate concurrently
+        results = await asyncio.gather(
+            *(self._enrich(item, user_id) for _, item, user_id in candidates),
+            return_exceptions=True
+        )
+
+        for (channel, item, _), result in zip(candidates, results):
+            if isinstance(result, Exception):
+                log.error("Error fetching RapidAPI data for item %s: %s", item.id, result)
+                continue
+
+            user_feedback, rapid_api_description = result
+            try:
+                await self.send_item_to_discord(channel, item, user_feedback, rapid_api_description)
+                self._mark_sent(item.id)
+            except Exception as e:
+                log.error("Error sending item to Discord: %s", e)
+
+    @check_vinted.before_loop
+    async def before_check_vinted(self):
+        # The channel cache is only populated once the bot is ready. Resolve here rather
+        # than in on_ready, which may still be running when the first tick starts.
+        await self.wait_until_ready()
+        self._resolve_brand_channels()
 
 
 # Initialize and run the bot
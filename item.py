@@ -2,14 +2,30 @@ import logging
 from datetime import datetime, timezone
 import json
 
-logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
+# Top-level keys read by the deferred description and timestamp extractors
+_DEFERRED_KEYS = (
+    "description", "item_box", "props", "sections",
+    "photo", "created_at_ts", "last_loged_on_ts",
+)
 
 class Item:
+    __slots__ = (
+        "_source", "_user", "id", "user_id", "title", "price", "currency", "brand_title", "size_title",
+        "url", "photo_url", "rapid_api_description", "status",
+        "_description", "_created_at_ts", "_created_at_epoch", "_user_feedback",
+    )
+
     def __init__(self, data):
-        logging.debug(f"Initializing Item with raw data keys: {list(data.keys())}")
-        self.raw_data = data
+        log.debug("Initializing Item with raw data keys: %s", data.keys())
+        # Keep only the parts of the payload the deferred extractors need,
+        # so the rest of the listing JSON can be freed
+        self._source = {key: data[key] for key in _DEFERRED_KEYS if key in data}
+        self._user = data.get("user", {})
 
         self.id = data.get("id", "Unknown ID")
+        self.user_id = self._user.get("id")
         self.title = data.get("title", "No title provided")
         self.price = data.get("price", "Unknown price")
         self.currency = data.get("currency", "Unknown currency")
@@ -20,19 +36,41 @@ class Item:
         # Handle photo data
         self.photo_url = data.get("photo", {}).get("url", "No photo URL")
 
-        # Extract description using the enhanced approach
-        self.description = self._extract_description(data)
-        
         # Add field for RapidAPI description
         self.rapid_api_description = None
 
-        # Handle created_at timestamp
-        self.created_at_ts = self._parse_timestamp(data)
-        
         self.status = data.get("status", "Unknown status")
 
-        # Extract user feedback data
-        self.user_feedback = self._extract_user_feedback(data)
+        # Description, timestamp and feedback are only needed for items that pass
+        # the bot's filters, so they are extracted on first access.
+        self._description = None
+        self._created_at_ts = None
+        self._created_at_epoch = None
+        self._user_feedback = None
+
+    @property
+    def description(self):
+        if self._description is None:
+            self._description = self._extract_description(self._source)
+        return self._description
+
+    @property
+    def created_at_ts(self):
+        if self._created_at_ts is None:
+            self._created_at_ts = self._parse_timestamp(self._source)
+        return self._created_at_ts
+
+    @property
+    def created_at_epoch(self):
+        if self._created_at_epoch is None:
+            self._created_at_epoch = int(self.created_at_ts.timestamp())
+        return self._created_at_epoch
+
+    @property
+    def user_feedback(self):
+        if self._user_feedback is None:
+            self._user_feedback = self._extract_user_feedback(self._user)
+        return self._user_feedback
 
     def update_description_from_rapid_api(self, rapid_api_description):
         """
@@ -43,7 +81,7 @@ class Item:
         """
         if rapid_api_description:
             self.rapid_api_description = rapid_api_description
-            logging.debug(f"Updated RapidAPI description for item {self.id}")
+            log.debug("Updated RapidAPI description for item %s", self.id)
 
     def get_description(self):
         """
@@ -74,13 +112,13 @@ class Item:
         item_box = data.get("item_box", {})
         if "description" in item_box:
             description_candidates.append(item_box["description"])
-            logging.debug("Description found in item_box.")
+            log.debug("Description found in item_box.")
 
         # Check for description in 'props.pageProps.itemDto'
         item_dto = data.get("props", {}).get("pageProps", {}).get("itemDto", {})
         if "description" in item_dto:
             description_candidates.append(item_dto["description"])
-            logging.debug("Description found in itemDto.")
+            log.debug("Description found in itemDto.")
 
         # Check for nested description sections
         sections = data.get("sections", [])
@@ -89,28 +127,27 @@ class Item:
                 section_description = section.get("data", {}).get("description")
                 if section_description:
                     description_candidates.append(section_description)
-                    logging.debug("Description found in 'data' under 'name': 'description'.")
+                    log.debug("Description found in 'data' under 'name': 'description'.")
 
         # Return the first valid description or a default message
         for description in description_candidates:
             if description and description.strip():
                 return description.strip()
 
-        logging.warning("No description found in provided data, item_box, or nested structures.")
+        log.warning("No description found in provided data, item_box, or nested structures.")
         return "No description provided"
 
-    def _extract_user_feedback(self, data):
+    def _extract_user_feedback(self, user_data):
         """
-        Extracts user feedback information from the raw data.
+        Extracts user feedback information from the user data.
         
         Args:
-            data (dict): The raw data containing user feedback.
+            user_data (dict): The 'user' section of the raw data.
         
         Returns:
             dict: A dictionary containing feedback counts.
         """
         feedback = {}
-        user_data = data.get("user", {})
 
         feedback['positive_feedback_count'] = user_data.get("positive_feedback_count", 0)
         feedback['neutral_feedback_count'] = user_data.get("neutral_feedback_count", 0)
@@ -154,9 +191,9 @@ class Item:
                     pass
 
         except (ValueError, TypeError) as e:
-            logging.error(f"Error parsing timestamp for item {self.id}: {e}")
+            log.error("Error parsing timestamp for item %s: %s", self.id, e)
 
-        logging.warning(f"No valid timestamp found for item {self.id}. Using current time.")
+        log.warning("No valid timestamp found for item %s. Using current time.", self.id)
         return datetime.now(timezone.utc)
 
     def __str__(self):